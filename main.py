@@ -4,23 +4,26 @@
 
 import logging
 import os
-import random
+import sys
 import tkinter as tk
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import combinations
 from tkinter import messagebox
 
+import numpy as np
 import pandas as pd
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 
 # --- Constantes ---
-ARQUIVO_EXCEL_MEGA_SENA = "Mega-Sena.xlsx"
-ARQUIVO_EXCEL_APOSTAS = "apostas.xlsx"
 ARQUIVO_LOG = "log.txt"
-NUMERO_DE_NUMEROS_POR_APOSTA = 6
-INTERVALO_NUMEROS = range(1, 61)
 MAX_TENTATIVAS_VALIDACAO = 100
+BOLAS_POR_LINHA = 10
+TAMANHO_BLOCO_SORTEIOS = 1024
 
 # --- Configuração do Logging ---
 logging.basicConfig(
@@ -32,95 +35,221 @@ logging.basicConfig(
     ]
 )
 
+
+@dataclass(frozen=True)
+class Jogo:
+    """Definição de uma modalidade: universo de números, tamanho do bilhete,
+    colunas da planilha histórica e regras de equilíbrio. Regras com valor
+    None ficam desativadas.
+    """
+    nome: str
+    universo: int
+    numeros_por_aposta: int
+    numeros_por_sorteio: int
+    arquivo_dados: str
+    arquivo_apostas: str
+    coluna_inicial: int = 2  # colunas antes das bolas (ex.: Concurso, Data)
+    sequencia_proibida: int | None = 4  # rejeita N números consecutivos
+    max_multiplos_5: int | None = 3  # rejeita a partir de N múltiplos de 5
+    min_dezenas_visual: int = 3  # padrão visual: rejeita com menos décadas
+    pares: tuple[int, int] = (2, 4)
+    min_decadas: int = 4
+    soma: tuple[int, int] = (150, 210)
+
+    @property
+    def numeros(self) -> range:
+        return range(1, self.universo + 1)
+
+    @property
+    def colunas(self) -> slice:
+        """Fatia posicional das colunas com as bolas sorteadas."""
+        return slice(self.coluna_inicial, self.coluna_inicial + self.numeros_por_sorteio)
+
+    @property
+    def colunas_apostas(self) -> list[str]:
+        return [f"N{i}" for i in range(1, self.numeros_por_aposta + 1)]
+
+
+MEGA_SENA = Jogo(
+    nome="Mega-Sena",
+    universo=60,
+    numeros_por_aposta=6,
+    numeros_por_sorteio=6,
+    arquivo_dados="Mega-Sena.xlsx",
+    arquivo_apostas="apostas.xlsx",
+)
+
+LOTOFACIL = Jogo(
+    nome="Lotofácil",
+    universo=25,
+    numeros_por_aposta=15,
+    numeros_por_sorteio=15,
+    arquivo_dados="Lotofacil.xlsx",
+    arquivo_apostas="apostas-lotofacil.xlsx",
+    # Em 15 de 25, sequências longas e múltiplos de 5 são a regra, não exceção
+    sequencia_proibida=None,
+    max_multiplos_5=None,
+    pares=(6, 9),
+    min_decadas=3,
+    soma=(175, 215),
+)
+
+QUINA = Jogo(
+    nome="Quina",
+    universo=80,
+    numeros_por_aposta=5,
+    numeros_por_sorteio=5,
+    arquivo_dados="Quina.xlsx",
+    arquivo_apostas="apostas-quina.xlsx",
+    pares=(1, 4),
+    soma=(160, 245),
+)
+
+JOGOS = {"megasena": MEGA_SENA, "lotofacil": LOTOFACIL, "quina": QUINA}
+
+
+@lru_cache(maxsize=None)
+def indices_combinacoes(n: int, r: int) -> np.ndarray:
+    """Índices (C(n,r), r) de todas as combinações de r posições entre n."""
+    return np.array(list(combinations(range(n), r)), dtype=np.intp).reshape(-1, r)
+
+
+class TabelaCoocorrencia:
+    """Co-ocorrência histórica compacta: pares numa matriz densa simétrica
+    (universo+1)² e trincas como chaves inteiras ordenadas com contagens, de
+    modo que só as trincas observadas ocupam memória.
+    """
+
+    def __init__(self, sorteios: np.ndarray, universo: int):
+        self.base = universo + 1
+        self.pares = np.zeros((self.base, self.base), dtype=np.int32)
+        chaves_blocos, contagens_blocos = [], []
+        n = sorteios.shape[1]
+        idx2 = indices_combinacoes(n, 2)
+        idx3 = indices_combinacoes(n, 3)
+        # Processa em blocos para limitar a memória temporária com históricos longos
+        for inicio in range(0, len(sorteios), TAMANHO_BLOCO_SORTEIOS):
+            bloco = sorteios[inicio:inicio + TAMANHO_BLOCO_SORTEIOS]
+            np.add.at(self.pares, (bloco[:, idx2[:, 0]].ravel(), bloco[:, idx2[:, 1]].ravel()), 1)
+            if len(idx3):
+                chaves, contagens = np.unique(self._codificar(bloco[:, idx3]), return_counts=True)
+                chaves_blocos.append(chaves)
+                contagens_blocos.append(contagens)
+        self.pares += self.pares.T
+
+        if chaves_blocos:
+            chaves, inverso = np.unique(np.concatenate(chaves_blocos), return_inverse=True)
+            contagens = np.bincount(inverso, weights=np.concatenate(contagens_blocos))
+        else:
+            chaves, contagens = np.empty(0, dtype=np.int64), np.empty(0)
+        self.chaves_trincas = chaves
+        self.contagens_trincas = contagens.astype(np.int32)
+
+    @property
+    def total_pares(self) -> int:
+        return int(np.count_nonzero(np.triu(self.pares)))
+
+    @property
+    def total_trincas(self) -> int:
+        return len(self.chaves_trincas)
+
+    def _codificar(self, trios: np.ndarray) -> np.ndarray:
+        """Codifica trincas ordenadas (..., 3) como a*base² + b*base + c."""
+        trios = trios.astype(np.int64)
+        return (trios[..., 0] * self.base + trios[..., 1]) * self.base + trios[..., 2]
+
+    def contagem_trincas(self, trios: np.ndarray) -> np.ndarray:
+        """Contagem histórica de cada trinca (..., 3); a ordem interna é indiferente."""
+        chaves = self._codificar(np.sort(trios, axis=-1))
+        if not len(self.chaves_trincas):
+            return np.zeros(chaves.shape, dtype=np.int32)
+        pos = np.minimum(np.searchsorted(self.chaves_trincas, chaves), len(self.chaves_trincas) - 1)
+        return np.where(self.chaves_trincas[pos] == chaves, self.contagens_trincas[pos], 0)
+
+
+def criar_sequencia_semente(semente: int | np.random.SeedSequence | None = None) -> np.random.SeedSequence:
+    """Cria a SeedSequence de um job. Sem semente, usa entropia do SO e registra
+    o valor no log para que a execução possa ser reproduzida depois.
+    """
+    if isinstance(semente, np.random.SeedSequence):
+        return semente
+    ss = np.random.SeedSequence(semente)
+    if semente is None:
+        logging.info(f"Semente gerada automaticamente: {ss.entropy}")
+    return ss
+
+
+def criar_rng(semente: int | np.random.SeedSequence | None = None) -> np.random.Generator:
+    """Cria um gerador NumPy independente (PCG64) a partir de uma semente ou SeedSequence."""
+    return np.random.Generator(np.random.PCG64(criar_sequencia_semente(semente)))
+
+
 class LotteryLogic:
     """Lida com a lógica de negócio para geração de apostas."""
 
-    def __init__(self, mega_sena_file: str):
-        self.mega_sena_file = mega_sena_file
+    def __init__(self, arquivo_dados: str | None = None, jogo: Jogo = MEGA_SENA):
+        self.jogo = jogo
+        self.arquivo_dados = arquivo_dados or jogo.arquivo_dados
+        self.sorteios = self._carregar_sorteios()
         self.frequencias = self._calcular_frequencia_numeros()
-        self.pares_coocorrencia = self._calcular_coocorrencia_pares()
-        self.trincas_coocorrencia = self._calcular_coocorrencia_trincas()
+        self.coocorrencia = self._calcular_coocorrencia()
         # Frequências suavizadas (Bayes) para uso auxiliar
         self.freq_suavizadas = self._calcular_frequencias_suavizadas(alpha=80)
 
-    def _calcular_frequencia_numeros(self) -> dict[int, int] | None:
-        """Calcula a frequência dos números usando Pandas."""
+    def _carregar_sorteios(self) -> np.ndarray | None:
+        """Lê a planilha histórica uma única vez e devolve os sorteios válidos
+        como matriz (sorteios x numeros_por_sorteio), ordenada por linha.
+        """
         try:
-            logging.info(f"Lendo o arquivo de dados: {self.mega_sena_file}")
-            df = pd.read_excel(self.mega_sena_file)
-            numeros_cols = df.columns[2:8]
-            frequencias = defaultdict(int)
-            for col in numeros_cols:
-                for numero in df[col].dropna():
-                    if 1 <= int(numero) <= 60:
-                        frequencias[int(numero)] += 1
-            logging.info(f"Frequências calculadas para {len(frequencias)} números.")
-            return frequencias
+            logging.info(f"Lendo o arquivo de dados ({self.jogo.nome}): {self.arquivo_dados}")
+            df = pd.read_excel(self.arquivo_dados)
+            bolas = df.iloc[:, self.jogo.colunas]
+            if bolas.shape[1] != self.jogo.numeros_por_sorteio:
+                raise ValueError(
+                    f"esperadas {self.jogo.numeros_por_sorteio} colunas de bolas, encontradas {bolas.shape[1]}"
+                )
+            valores = bolas.apply(pd.to_numeric, errors="coerce").dropna().to_numpy(dtype=np.int64)
+            sorteios = np.sort(valores, axis=1)
+            # Descarta linhas fora do universo ou com números repetidos
+            validos = (
+                (sorteios[:, 0] >= 1)
+                & (sorteios[:, -1] <= self.jogo.universo)
+                & (np.diff(sorteios, axis=1) > 0).all(axis=1)
+            )
+            sorteios = sorteios[validos].astype(np.int16)
+            logging.info(f"{len(sorteios)} sorteios válidos carregados.")
+            return sorteios
         except FileNotFoundError:
-            logging.error(f"Arquivo de dados não encontrado: {self.mega_sena_file}")
-            messagebox.showerror("Erro", f"Arquivo de dados não encontrado: {self.mega_sena_file}")
+            logging.error(f"Arquivo de dados não encontrado: {self.arquivo_dados}")
+            messagebox.showerror("Erro", f"Arquivo de dados não encontrado: {self.arquivo_dados}")
             return None
         except Exception as e:
-            logging.error(f"Erro ao calcular a frequência dos números: {e}")
+            logging.error(f"Erro ao ler o arquivo de dados: {e}")
             messagebox.showerror("Erro", f"Erro ao processar o arquivo de dados: {e}")
             return None
 
-    def _calcular_coocorrencia_pares(self) -> dict[tuple[int, int], int] | None:
-        """Calcula a co-ocorrência de pares de números a partir da base histórica."""
-        try:
-            logging.info("Calculando co-ocorrência de pares de números.")
-            df = pd.read_excel(self.mega_sena_file)
-            numeros_cols = df.columns[2:8]
-            cooc = defaultdict(int)
-            for _, row in df[numeros_cols].dropna().iterrows():
-                try:
-                    nums = [int(x) for x in row.values if 1 <= int(x) <= 60]
-                except Exception:
-                    nums = []
-                if len(nums) == 6:
-                    nums_sorted = sorted(set(nums))
-                    # Atualiza contagem para todos os pares únicos
-                    for i in range(len(nums_sorted)):
-                        for j in range(i + 1, len(nums_sorted)):
-                            a, b = nums_sorted[i], nums_sorted[j]
-                            cooc[(a, b)] += 1
-            logging.info(f"Co-ocorrência calculada para {len(cooc)} pares.")
-            return cooc
-        except FileNotFoundError:
-            logging.error(f"Arquivo de dados não encontrado: {self.mega_sena_file}")
+    def _calcular_frequencia_numeros(self) -> dict[int, int] | None:
+        """Calcula a frequência dos números a partir dos sorteios carregados."""
+        if self.sorteios is None:
             return None
-        except Exception as e:
-            logging.error(f"Erro ao calcular co-ocorrência de pares: {e}")
+        contagens = np.bincount(self.sorteios.ravel(), minlength=self.jogo.universo + 1)
+        frequencias = {n: int(contagens[n]) for n in self.jogo.numeros if contagens[n] > 0}
+        logging.info(f"Frequências calculadas para {len(frequencias)} números.")
+        return frequencias
+
+    def _calcular_coocorrencia(self) -> TabelaCoocorrencia | None:
+        """Calcula a co-ocorrência de pares e trincas a partir da base histórica."""
+        if self.sorteios is None:
             return None
-
-    def _calcular_coocorrencia_trincas(self) -> dict[tuple[int, int, int], int] | None:
-        """Calcula a co-ocorrência de trincas de números a partir da base histórica."""
         try:
-            logging.info("Calculando co-ocorrência de trincas de números.")
-            df = pd.read_excel(self.mega_sena_file)
-            numeros_cols = df.columns[2:8]
-            cooc3 = defaultdict(int)
-            for _, row in df[numeros_cols].dropna().iterrows():
-                try:
-                    nums = [int(x) for x in row.values if 1 <= int(x) <= 60]
-                except Exception:
-                    nums = []
-                if len(nums) == 6:
-                    nums_sorted = sorted(set(nums))
-                    if len(nums_sorted) == 6:
-                        # 20 trincas por bilhete
-                        for i in range(0, 4):
-                            for j in range(i + 1, 5):
-                                for k in range(j + 1, 6):
-                                    a, b, c = nums_sorted[i], nums_sorted[j], nums_sorted[k]
-                                    cooc3[(a, b, c)] += 1
-            logging.info(f"Co-ocorrência calculada para {len(cooc3)} trincas.")
-            return cooc3
-        except FileNotFoundError:
-            logging.error(f"Arquivo de dados não encontrado: {self.mega_sena_file}")
-            return None
+            logging.info("Calculando co-ocorrência de pares e trincas de números.")
+            cooc = TabelaCoocorrencia(self.sorteios, self.jogo.universo)
+            logging.info(
+                f"Co-ocorrência calculada para {cooc.total_pares} pares e {cooc.total_trincas} trincas."
+            )
+            return cooc
         except Exception as e:
-            logging.error(f"Erro ao calcular co-ocorrência de trincas: {e}")
+            logging.error(f"Erro ao calcular co-ocorrência: {e}")
             return None
 
     def _calcular_frequencias_suavizadas(self, alpha: int = 80) -> dict[int, float] | None:
@@ -129,26 +258,29 @@ class LotteryLogic:
         """
         if not self.frequencias:
             return None
+        universo = self.jogo.universo
         total_obs = sum(self.frequencias.values())
         if total_obs == 0:
-            return {n: 1.0 / 60.0 for n in range(1, 61)}
-        # prior simétrico: alpha para cada número, total 60*alpha
+            return {n: 1.0 / universo for n in self.jogo.numeros}
+        # prior simétrico: alpha para cada número, total universo*alpha
         suav = {}
-        prior_total = 60 * alpha
-        for n in range(1, 61):
+        prior_total = universo * alpha
+        for n in self.jogo.numeros:
             f = self.frequencias.get(n, 0)
             suav[n] = (f + alpha) / (total_obs + prior_total)
         return suav
 
-    def gerar_aposta_analisada(self) -> list[int] | None:
+    def gerar_aposta_analisada(self, rng: np.random.Generator | None = None) -> list[int] | None:
         """Gera uma aposta com análise e probabilidade ponderada."""
+        if rng is None:
+            rng = criar_rng()
         if not self.frequencias:
             logging.warning("Não foi possível gerar aposta pois não há dados de frequência.")
             return None
 
         tentativas = 0
         while tentativas < MAX_TENTATIVAS_VALIDACAO:
-            aposta_temp = self._gerar_aposta_ponderada()
+            aposta_temp = self._gerar_aposta_ponderada(rng)
             if aposta_temp and not self._validar_regras(aposta_temp):
                 logging.info(f"Aposta gerada e validada: {aposta_temp}")
                 return aposta_temp
@@ -157,18 +289,19 @@ class LotteryLogic:
         logging.warning(f"Não foi possível gerar uma aposta válida após {MAX_TENTATIVAS_VALIDACAO} tentativas.")
         return None
 
-    def _gerar_aposta_ponderada(self) -> list[int] | None:
+    def _gerar_aposta_ponderada(self, rng: np.random.Generator) -> list[int] | None:
         """Gera uma aposta com base na frequência ponderada dos números de forma eficiente."""
-        numeros = list(self.frequencias.keys())
-        pesos = list(self.frequencias.values())
+        numeros = sorted(self.frequencias.keys())
+        pesos = np.array([self.frequencias[n] for n in numeros], dtype=float)
 
-        if len(numeros) < NUMERO_DE_NUMEROS_POR_APOSTA:
+        if len(numeros) < self.jogo.numeros_por_aposta:
             logging.warning("Não há números únicos suficientes para gerar uma aposta.")
             return None
 
+        probs = pesos / pesos.sum()
         aposta = set()
-        while len(aposta) < NUMERO_DE_NUMEROS_POR_APOSTA:
-            numero_escolhido = random.choices(numeros, weights=pesos, k=1)[0]
+        while len(aposta) < self.jogo.numeros_por_aposta:
+            numero_escolhido = numeros[int(rng.choice(len(numeros), p=probs))]
             aposta.add(numero_escolhido)
         
         return sorted(list(aposta))
@@ -186,109 +319,105 @@ class LotteryLogic:
         return False
 
     def _tem_sequencia_consecutiva(self, numeros: list[int]) -> bool:
-        for i in range(len(numeros) - 3):
-            if numeros[i+1] == numeros[i]+1 and numeros[i+2] == numeros[i]+2 and numeros[i+3] == numeros[i]+3:
+        tamanho = self.jogo.sequencia_proibida
+        if tamanho is None:
+            return False
+        for i in range(len(numeros) - tamanho + 1):
+            if numeros[i + tamanho - 1] - numeros[i] == tamanho - 1:
                 return True
         return False
 
     def _muitos_multiplos_de_5(self, numeros: list[int]) -> bool:
-        return sum(1 for n in numeros if n % 5 == 0) >= 3
+        limite = self.jogo.max_multiplos_5
+        return limite is not None and sum(1 for n in numeros if n % 5 == 0) >= limite
 
     def _padrao_visual_obvio(self, numeros: list[int]) -> bool:
         dezenas = {n // 10 for n in numeros}
-        return len(dezenas) <= 2
+        return len(dezenas) < self.jogo.min_dezenas_visual
 
     # --- Estratégia 1: Aleatória uniforme com equilíbrio ---
-    def gerar_aposta_estrategia1(self) -> list[int] | None:
+    def gerar_aposta_estrategia1(self, rng: np.random.Generator | None = None) -> list[int] | None:
         """Gera aposta por amostragem uniforme aplicando restrições leves de equilíbrio.
-        Critérios:
+        Critérios (limites definidos pelo Jogo; valores da Mega-Sena):
         - 2 a 4 números pares (preferência por 3 pares/3 ímpares)
         - Cobertura de ao menos 4 décadas distintas
         - Soma entre 150 e 210
         - Evita regras já existentes (sequências de 4+, muitos múltiplos de 5)
         """
+        if rng is None:
+            rng = criar_rng()
+        universo = np.array(self.jogo.numeros)
         tentativas = 0
         while tentativas < MAX_TENTATIVAS_VALIDACAO:
-            aposta = sorted(random.sample(list(INTERVALO_NUMEROS), NUMERO_DE_NUMEROS_POR_APOSTA))
+            sorteio = rng.choice(universo, size=self.jogo.numeros_por_aposta, replace=False)
+            aposta = sorted(int(n) for n in sorteio)
             if not self._validar_regras_equilibrio(aposta):
                 return aposta
             tentativas += 1
         return None
 
     # --- Estratégia 2: Maximiza raridade de pares (cobertura) ---
-    def gerar_aposta_estrategia2(self) -> list[int] | None:
+    def gerar_aposta_estrategia2(self, rng: np.random.Generator | None = None) -> list[int] | None:
         """Gera aposta priorizando pares historicamente raros (baixa co-ocorrência),
         mantendo restrições de equilíbrio semelhantes à estratégia 1.
         """
-        if not self.pares_coocorrencia:
+        if rng is None:
+            rng = criar_rng()
+        cooc = self.coocorrencia
+        if cooc is None or cooc.total_pares == 0:
             logging.warning("Co-ocorrência de pares indisponível; utilizando estratégia 1 como fallback.")
-            return self.gerar_aposta_estrategia1()
+            return self.gerar_aposta_estrategia1(rng)
 
         # Pesos de raridade dos pares: w = 1/(freq+1)
-        wpar = defaultdict(lambda: 1.0)
-        for (a, b), c in self.pares_coocorrencia.items():
-            wpar[(a, b)] = 1.0 / (c + 1)
+        wpar = 1.0 / (cooc.pares + 1)
+        usar_trincas = cooc.total_trincas > 0
 
         # Peso auxiliar por número baseado em suavização (quanto menor prob., maior incentivo)
-        invfreq = defaultdict(lambda: 1.0)
+        invfreq = np.ones(self.jogo.universo + 1)
         if self.freq_suavizadas:
             for n, p in self.freq_suavizadas.items():
                 invfreq[n] = 1.0 / (p + 1e-6)
 
+        k = self.jogo.numeros_por_aposta
+        numeros = np.array(self.jogo.numeros)
+        idx2 = indices_combinacoes(k, 2)
+        idx3 = indices_combinacoes(k, 3)
         melhor_aposta = None
         melhor_score = -1.0
         for _ in range(50):  # múltiplas tentativas para escapar de ótimos locais
-            escolhidos = []
-            candidatos = set(INTERVALO_NUMEROS)
             # semente aleatória
-            seed = random.choice(list(candidatos))
-            escolhidos.append(seed)
-            candidatos.remove(seed)
-
-            while len(escolhidos) < NUMERO_DE_NUMEROS_POR_APOSTA:
-                melhor_c = None
-                melhor_s = -1.0
-                for c in candidatos:
-                    # soma de raridade com os já escolhidos
-                    s = 0.0
-                    for e in escolhidos:
-                        a, b = (e, c) if e < c else (c, e)
-                        s += wpar[(a, b)]
-                    # contribuição de trincas raras, aproximada: combine c com dois dos escolhidos
-                    if self.trincas_coocorrencia:
-                        le = len(escolhidos)
-                        if le >= 2:
-                            for i in range(le):
-                                for j in range(i + 1, le):
-                                    tri = tuple(sorted([escolhidos[i], escolhidos[j], c]))
-                                    freq_tri = self.trincas_coocorrencia.get(tri, 0)
-                                    s += 0.5 * (1.0 / (freq_tri + 1))
-                    # pequeno incentivo a números com menor frequência individual
-                    s += 0.1 * invfreq[c]
-                    if s > melhor_s:
-                        melhor_s = s
-                        melhor_c = c
+            seed = int(rng.choice(numeros))
+            escolhidos = [seed]
+            disponivel = np.ones(self.jogo.universo + 1, dtype=bool)
+            disponivel[0] = False
+            disponivel[seed] = False
+
+            while len(escolhidos) < k:
+                # Pontua todos os candidatos de uma vez (ordem crescente, empate fica com o menor)
+                candidatos = np.flatnonzero(disponivel)
+                # soma de raridade com os já escolhidos
+                s = wpar[np.ix_(escolhidos, candidatos)].sum(axis=0)
+                # contribuição de trincas raras, aproximada: combine c com dois dos escolhidos
+                if usar_trincas and len(escolhidos) >= 2:
+                    pares_esc = np.array(escolhidos)[indices_combinacoes(len(escolhidos), 2)]
+                    trios = np.empty((len(pares_esc), len(candidatos), 3), dtype=np.int64)
+                    trios[..., 0] = pares_esc[:, 0, None]
+                    trios[..., 1] = pares_esc[:, 1, None]
+                    trios[..., 2] = candidatos[None, :]
+                    s += 0.5 * (1.0 / (cooc.contagem_trincas(trios) + 1)).sum(axis=0)
+                # pequeno incentivo a números com menor frequência individual
+                s += 0.1 * invfreq[candidatos]
+                melhor_c = int(candidatos[np.argmax(s)])
                 escolhidos.append(melhor_c)
-                candidatos.remove(melhor_c)
+                disponivel[melhor_c] = False
 
             aposta = sorted(escolhidos)
             if not self._validar_regras_equilibrio(aposta):
                 # score final: raridade de pares + trincas + entropia por décadas
-                score_total = 0.0
-                # pares
-                for i in range(len(aposta)):
-                    for j in range(i + 1, len(aposta)):
-                        a, b = aposta[i], aposta[j]
-                        score_total += wpar[(a, b)]
-                # trincas
-                if self.trincas_coocorrencia:
-                    for i in range(0, 4):
-                        for j in range(i + 1, 5):
-                            for k in range(j + 1, 6):
-                                tri = tuple(sorted([aposta[i], aposta[j], aposta[k]]))
-                                freq_tri = self.trincas_coocorrencia.get(tri, 0)
-                                score_total += 0.5 * (1.0 / (freq_tri + 1))
-                # entropia por décadas
+                arr = np.array(aposta)
+                score_total = float(wpar[arr[idx2[:, 0]], arr[idx2[:, 1]]].sum())
+                if usar_trincas:
+                    score_total += float(0.5 * (1.0 / (cooc.contagem_trincas(arr[idx3]) + 1)).sum())
                 score_total += 0.3 * self._entropia_decadas(aposta)
                 if score_total > melhor_score:
                     melhor_score = score_total
@@ -306,14 +435,15 @@ class LotteryLogic:
             return True
         # Regras de equilíbrio
         pares = sum(1 for n in numeros_sorted if n % 2 == 0)
-        impares = NUMERO_DE_NUMEROS_POR_APOSTA - pares
-        if not (2 <= pares <= 4):
+        pares_min, pares_max = self.jogo.pares
+        if not (pares_min <= pares <= pares_max):
             return True
         dezenas = {n // 10 for n in numeros_sorted}
-        if len(dezenas) < 4:  # cobertura mínima de 4 décadas
+        if len(dezenas) < self.jogo.min_decadas:  # cobertura mínima de décadas
             return True
         soma = sum(numeros_sorted)
-        if not (150 <= soma <= 210):
+        soma_min, soma_max = self.jogo.soma
+        if not (soma_min <= soma <= soma_max):
             return True
         return False
 
@@ -333,52 +463,87 @@ class LotteryLogic:
         return ent / ent_max if ent_max > 0 else ent
 
     # --- Geração de portfólio (Estratégia 2) ---
-    def gerar_portfolio_estrategia2(self, quantidade: int) -> list[list[int]]:
+    def gerar_portfolio_estrategia2(self, quantidade: int, semente: int | None = None,
+                                    workers: int = 1) -> list[list[int]]:
         """Gera N apostas maximizando cobertura de pares/trincas e baixa sobreposição.
         Simples heurística: gerar candidatas via gerar_aposta_estrategia2 e aceitar
         aquelas que adicionam mais pares/trincas novos ao conjunto atual.
+        A candidata i usa sempre o i-ésimo fluxo filho da semente, então o resultado
+        é o mesmo com qualquer número de workers.
         """
+        ss = criar_sequencia_semente(semente)
+        max_tentativas = quantidade * 10
+        fluxos = ss.spawn(max_tentativas)
         portfolio: list[list[int]] = []
         pares_cobertos = set()
         trincas_cobertas = set()
 
         tentativas = 0
-        while len(portfolio) < quantidade and tentativas < quantidade * 10:
-            cand = self.gerar_aposta_estrategia2()
-            tentativas += 1
-            if not cand:
-                continue
-            # medir ganho de cobertura
-            novos_pares = set()
-            for i in range(6):
-                for j in range(i + 1, 6):
-                    a, b = cand[i], cand[j]
-                    novos_pares.add((a, b))
-            ganho_pares = len(novos_pares - pares_cobertos)
-
-            novos_trincas = set()
-            for i in range(0, 4):
-                for j in range(i + 1, 5):
-                    for k in range(j + 1, 6):
-                        tri = tuple(sorted([cand[i], cand[j], cand[k]]))
-                        novos_trincas.add(tri)
-            ganho_trincas = len(novos_trincas - trincas_cobertas)
-
-            # aceitador simples: exige algum ganho de cobertura
-            if ganho_pares + ganho_trincas > 0:
-                portfolio.append(cand)
-                pares_cobertos |= novos_pares
-                trincas_cobertas |= novos_trincas
+        lote = max(1, workers)
+        while len(portfolio) < quantidade and tentativas < max_tentativas:
+            # Candidatas geradas em lote; a aceitação segue a ordem dos índices
+            candidatas = self._executar_jobs(
+                self.gerar_aposta_estrategia2, fluxos[tentativas:tentativas + lote], workers
+            )
+            for cand in candidatas:
+                tentativas += 1
+                if len(portfolio) >= quantidade:
+                    break
+                if not cand:
+                    continue
+                self._aceitar_no_portfolio(cand, portfolio, pares_cobertos, trincas_cobertas)
 
         # se insuficiente, completa com estratégia 1
+        fluxos_e1 = iter(ss.spawn(quantidade))
         while len(portfolio) < quantidade:
-            alt = self.gerar_aposta_estrategia1()
+            alt = self.gerar_aposta_estrategia1(criar_rng(next(fluxos_e1)))
             if alt:
                 portfolio.append(alt)
             else:
                 break
         return portfolio
 
+    @staticmethod
+    def _aceitar_no_portfolio(cand: list[int], portfolio: list[list[int]],
+                              pares_cobertos: set, trincas_cobertas: set) -> None:
+        """Adiciona a candidata ao portfólio se ela trouxer cobertura nova."""
+        # medir ganho de cobertura
+        novos_pares = set(combinations(cand, 2))
+        ganho_pares = len(novos_pares - pares_cobertos)
+
+        novos_trincas = set(combinations(cand, 3))
+        ganho_trincas = len(novos_trincas - trincas_cobertas)
+
+        # aceitador simples: exige algum ganho de cobertura
+        if ganho_pares + ganho_trincas > 0:
+            portfolio.append(cand)
+            pares_cobertos |= novos_pares
+            trincas_cobertas |= novos_trincas
+
+    # --- Geração em lote reprodutível ---
+    def gerar_lote(self, estrategia: str, quantidade: int, semente: int | None = None,
+                   workers: int = 1) -> list[list[int] | None]:
+        """Gera `quantidade` apostas independentes pela estratégia "E1" ou "E2".
+        Cada aposta i recebe o i-ésimo fluxo filho da semente (SeedSequence.spawn),
+        então o resultado é idêntico em execução serial, em lotes ou com N workers.
+        """
+        geradores = {"E1": self.gerar_aposta_estrategia1, "E2": self.gerar_aposta_estrategia2}
+        if estrategia not in geradores:
+            raise ValueError(f"Estratégia desconhecida: {estrategia}")
+        fluxos = criar_sequencia_semente(semente).spawn(quantidade)
+        return self._executar_jobs(geradores[estrategia], fluxos, workers)
+
+    @staticmethod
+    def _executar_jobs(gerador, fluxos: list[np.random.SeedSequence], workers: int) -> list:
+        """Executa `gerador` uma vez por fluxo, preservando a ordem dos resultados."""
+        def job(fluxo: np.random.SeedSequence):
+            return gerador(criar_rng(fluxo))
+
+        if workers <= 1 or len(fluxos) <= 1:
+            return [job(f) for f in fluxos]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(job, fluxos))
+
     # --- Relatório estatístico (qui-quadrado) ---
     def gerar_relatorio_estatistico(self) -> str:
         """Gera um resumo com teste de uniformidade por números (qui-quadrado)."""
@@ -389,16 +554,17 @@ class LotteryLogic:
             total = sum(self.frequencias.values())
             if total == 0:
                 return "Sem ocorrências nos dados."
-            esperado = total / 60.0
+            esperado = total / self.jogo.universo
             chi2 = 0.0
-            for n in range(1, 61):
+            for n in self.jogo.numeros:
                 obs = self.frequencias.get(n, 0)
                 chi2 += (obs - esperado) ** 2 / esperado
-            # gl = 59
+            gl = self.jogo.universo - 1
             resumo = (
+                f"Jogo: {self.jogo.nome}\n"
                 f"Total observações: {total}\n"
                 f"Esperado por número: {esperado:.2f}\n"
-                f"Qui-quadrado (gl=59): {chi2:.2f}\n"
+                f"Qui-quadrado (gl={gl}): {chi2:.2f}\n"
                 "Este resultado é apenas indicativo; use com cautela."
             )
             return resumo
@@ -406,48 +572,39 @@ class LotteryLogic:
             logging.error(f"Erro ao gerar relatório estatístico: {e}")
             return f"Erro ao gerar relatório: {e}"
 
-    @staticmethod
-    def salvar_aposta_excel(numeros: list[int], estrategia: str) -> None:
-        """Salva a aposta na planilha "apostas.xlsx" com a coluna da estratégia."""
+    def salvar_aposta_excel(self, numeros: list[int], estrategia: str) -> None:
+        """Salva a aposta na planilha de apostas do jogo com a coluna da estratégia."""
+        arquivo_apostas = self.jogo.arquivo_apostas
+        colunas_numeros = self.jogo.colunas_apostas
         try:
             data_atual = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             # Monta a linha como dict para evitar erro de 'mismatched columns'
-            nova_linha_dict = {
-                "Estrategia": estrategia,
-                "Data": data_atual,
-                "N1": numeros[0],
-                "N2": numeros[1],
-                "N3": numeros[2],
-                "N4": numeros[3],
-                "N5": numeros[4],
-                "N6": numeros[5],
-            }
-            
-            if not os.path.exists(ARQUIVO_EXCEL_APOSTAS):
-                df = pd.DataFrame(columns=["Estrategia", "Data", "N1", "N2", "N3", "N4", "N5", "N6"])
+            nova_linha_dict = {"Estrategia": estrategia, "Data": data_atual}
+            nova_linha_dict.update(zip(colunas_numeros, numeros))
+            colunas_alvo = ["Estrategia", "Data"] + colunas_numeros
+
+            if not os.path.exists(arquivo_apostas):
+                df = pd.DataFrame(columns=colunas_alvo)
                 df.loc[0] = nova_linha_dict
             else:
-                df = pd.read_excel(ARQUIVO_EXCEL_APOSTAS)
+                df = pd.read_excel(arquivo_apostas)
                 # Garantir coluna 'Estrategia'
                 if 'Estrategia' not in df.columns:
                     df.insert(0, 'Estrategia', '-')
                 # Garantir coluna 'Data'
                 if 'Data' not in df.columns:
                     df.insert(1, 'Data', pd.NA)
-                # Garantir ordem das colunas
-                colunas_alvo = ["Estrategia", "Data", "N1", "N2", "N3", "N4", "N5", "N6"]
-                # Se existir colunas extras, manter após as principais
-                # Garante colunas N1..N6
-                for c in ["N1","N2","N3","N4","N5","N6"]:
+                # Garante colunas N1..Nk
+                for c in colunas_numeros:
                     if c not in df.columns:
                         df[c] = pd.NA
                 # Reordena exatamente para as colunas alvo (descarta extras para evitar mismatch)
-                df = df[[c for c in colunas_alvo]]
+                df = df[colunas_alvo]
                 # Adiciona a nova linha por dict alinhando por nome de coluna
                 df.loc[len(df)] = nova_linha_dict
 
-            df.to_excel(ARQUIVO_EXCEL_APOSTAS, index=False)
-            logging.info(f"Aposta {numeros} (Estratégia: {estrategia}) salva em {ARQUIVO_EXCEL_APOSTAS}")
+            df.to_excel(arquivo_apostas, index=False)
+            logging.info(f"Aposta {numeros} (Estratégia: {estrategia}) salva em {arquivo_apostas}")
 
         except Exception as e:
             logging.error(f"Erro ao salvar a aposta no Excel: {e}")
@@ -463,8 +620,8 @@ class App(ttk.Window):
         
         logging.info("Iniciando a aplicação com interface moderna.")
 
-        self.title("Gerador de Apostas Mega-Sena")
-        # Aumenta largura para acomodar todos os 6 números visíveis
+        self.title(f"Gerador de Apostas {logic.jogo.nome}")
+        # Largura acomoda uma linha de até BOLAS_POR_LINHA números
         self.geometry("960x640")
         self.protocol("WM_DELETE_WINDOW", self._ao_fechar)
 
@@ -496,9 +653,9 @@ class App(ttk.Window):
         self.balls_frame.grid(row=1, column=0, pady=(10, 20))
 
         self.ball_labels = []
-        for i in range(NUMERO_DE_NUMEROS_POR_APOSTA):
+        for i in range(self.logic.jogo.numeros_por_aposta):
             label = ttk.Label(self.balls_frame, text="--", font=("-size 16 -weight bold"), anchor=CENTER, bootstyle=(INVERSE, PRIMARY), padding=10, width=3)
-            label.grid(row=0, column=i, padx=5)
+            label.grid(row=i // BOLAS_POR_LINHA, column=i % BOLAS_POR_LINHA, padx=5, pady=2)
             self.ball_labels.append(label)
 
         # Botões de geração por estratégia
@@ -527,7 +684,7 @@ class App(ttk.Window):
         history_title = ttk.Label(self.history_frame, text="Histórico de Apostas", font=("-size 14"))
         history_title.grid(row=0, column=0, sticky="w", pady=(0, 5))
         
-        cols = ("Estratégia", "Data", "N1", "N2", "N3", "N4", "N5", "N6")
+        cols = ("Estratégia", "Data", *self.logic.jogo.colunas_apostas)
         self.tree = ttk.Treeview(self.history_frame, columns=cols, show="headings", bootstyle=PRIMARY)
         
         for col in cols:
@@ -635,8 +792,9 @@ class App(ttk.Window):
             for item in self.tree.get_children():
                 self.tree.delete(item)
 
-            if os.path.exists(ARQUIVO_EXCEL_APOSTAS):
-                df = pd.read_excel(ARQUIVO_EXCEL_APOSTAS)
+            arquivo_apostas = self.logic.jogo.arquivo_apostas
+            if os.path.exists(arquivo_apostas):
+                df = pd.read_excel(arquivo_apostas)
                 
                 # Insere os novos dados em ordem reversa (mais recente primeiro)
                 for i, row in df.iloc[::-1].iterrows():
@@ -667,9 +825,16 @@ class App(ttk.Window):
             self.destroy()
 
 def main():
-    """Função principal para iniciar a aplicação."""
+    """Função principal para iniciar a aplicação. Aceita o jogo como argumento
+    opcional (megasena, lotofacil, quina); o padrão é a Mega-Sena.
+    """
+    nome_jogo = sys.argv[1].lower() if len(sys.argv) > 1 else "megasena"
+    jogo = JOGOS.get(nome_jogo)
+    if jogo is None:
+        logging.critical(f"Jogo desconhecido: {nome_jogo}. Opções: {', '.join(JOGOS)}")
+        return
     try:
-        logic = LotteryLogic(ARQUIVO_EXCEL_MEGA_SENA)
+        logic = LotteryLogic(jogo=jogo)
         if logic.frequencias is not None:
             app = App(logic)
             app.mainloop()